@@ -3,10 +3,22 @@ import asyncio
 import inspect
 import logging
 import logging.config
+from functools import partial
+import httpx
+import numpy as np
+import ollama
 from lightrag import LightRAG, QueryParam
+from lightrag.base import DocStatus
 from lightrag.llm.openai import openai_complete_if_cache
 from lightrag.llm.ollama import ollama_embed
-from lightrag.utils import EmbeddingFunc, logger, set_verbose_debug
+from lightrag.utils import (
+    EmbeddingFunc,
+    compute_args_hash,
+    compute_mdhash_id,
+    logger,
+    sanitize_text_for_encoding,
+    set_verbose_debug,
+)
 from lightrag.kg.shared_storage import initialize_pipeline_status
 
 from dotenv import load_dotenv
@@ -15,6 +27,13 @@ load_dotenv(dotenv_path=".env", override=False)
 
 WORKING_DIR = "./dickens"
 
+# Resolved once at import rather than on every LLM/embedding call
+LLM_MODEL = os.getenv("LLM_MODEL", "deepseek-chat")
+LLM_API_KEY = os.getenv("LLM_BINDING_API_KEY") or os.getenv("OPENAI_API_KEY")
+LLM_BASE_URL = os.getenv("LLM_BINDING_HOST", "https://api.deepseek.com")
+EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "bge-m3:latest")
+EMBEDDING_DIM = int(os.getenv("EMBEDDING_DIM", "1024"))
+
 
 def configure_logging():
     """Configure logging for the application"""
@@ -84,21 +103,84 @@ def configure_logging():
 if not os.path.exists(WORKING_DIR):
     os.mkdir(WORKING_DIR)
 
+# Shared clients so the many LLM and embedding calls made during insert and
+# query reuse keep-alive connections instead of reconnecting on every request
+llm_http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=int(os.getenv("LLM_TIMEOUT", "180")),
+)
+embedding_client = ollama.AsyncClient(
+    host=os.getenv("EMBEDDING_BINDING_HOST", "http://localhost:11434")
+)
+
 
 async def llm_model_func(
     prompt, system_prompt=None, history_messages=[], keyword_extraction=False, **kwargs
 ) -> str:
     return await openai_complete_if_cache(
-        os.getenv("LLM_MODEL", "deepseek-chat"),
+        LLM_MODEL,
         prompt,
         system_prompt=system_prompt,
         history_messages=history_messages,
-        api_key=os.getenv("LLM_BINDING_API_KEY") or os.getenv("OPENAI_API_KEY"),
-        base_url=os.getenv("LLM_BINDING_HOST", "https://api.deepseek.com"),
+        api_key=LLM_API_KEY,
+        base_url=LLM_BASE_URL,
+        openai_client_configs={"http_client": llm_http_client},
         **kwargs,
     )
 
 
+# Embeddings keyed by a hash of model name and text, persisted in WORKING_DIR so
+# texts already embedded in an earlier run are not sent to Ollama again
+EMBEDDING_CACHE_FILE = os.path.join(WORKING_DIR, "embedding_cache.npz")
+
+
+def load_embedding_cache() -> dict[str, np.ndarray]:
+    if not os.path.exists(EMBEDDING_CACHE_FILE):
+        return {}
+    with np.load(EMBEDDING_CACHE_FILE) as data:
+        return {key: data[key] for key in data.files}
+
+
+def save_embedding_cache():
+    np.savez(EMBEDDING_CACHE_FILE, **embedding_cache)
+
+
+embedding_cache: dict[str, np.ndarray] = load_embedding_cache()
+
+
+async def cached_ollama_embed(texts: list[str]) -> np.ndarray:
+    if not texts:
+        return np.array([])
+
+    keys = [compute_args_hash(EMBEDDING_MODEL, text) for text in texts]
+
+    missing = {
+        key: text for key, text in zip(keys, texts) if key not in embedding_cache
+    }
+    if missing:
+        embeddings = await ollama_embed(
+            list(missing.values()),
+            embed_model=EMBEDDING_MODEL,
+            client=embedding_client,
+        )
+        embedding_cache.update(zip(missing.keys(), embeddings))
+
+    return np.stack([embedding_cache[key] for key in keys])
+
+
+async def warm_up_llm():
+    """Open the LLM connection before the first real request needs it"""
+    # Any reply leaves a keep-alive connection in the shared pool, and unlike a
+    # completion this cannot trigger the empty-response retries
+    try:
+        await llm_http_client.get(
+            f"{LLM_BASE_URL.rstrip('/')}/models",
+            headers={"Authorization": f"Bearer {LLM_API_KEY}"},
+        )
+    except httpx.HTTPError as e:
+        logger.warning(f"LLM warm-up failed: {e}")
+
+
 async def print_stream(stream):
     async for chunk in stream:
         if chunk:
@@ -109,14 +191,15 @@ async def initialize_rag():
     rag = LightRAG(
         working_dir=WORKING_DIR,
         llm_model_func=llm_model_func,
+        # Chunks of a document are extracted concurrently, bounded by this limit
+        llm_model_max_async=int(os.getenv("MAX_ASYNC", "16")),
+        # Ollama serves requests largely one at a time, so fewer, larger batches
+        # raise embedding throughput more than extra concurrency does
+        embedding_batch_num=int(os.getenv("EMBEDDING_BATCH_NUM", "64")),
         embedding_func=EmbeddingFunc(
-            embedding_dim=int(os.getenv("EMBEDDING_DIM", "1024")),
+            embedding_dim=EMBEDDING_DIM,
             max_token_size=int(os.getenv("MAX_EMBED_TOKENS", "8192")),
-            func=lambda texts: ollama_embed(
-                texts,
-                embed_model=os.getenv("EMBEDDING_MODEL", "bge-m3:latest"),
-                host=os.getenv("EMBEDDING_BINDING_HOST", "http://localhost:11434"),
-            ),
+            func=cached_ollama_embed,
         ),
     )
 
@@ -127,30 +210,50 @@ async def initialize_rag():
 
 
 async def main():
+    rag = None
     try:
-        # Clear old data files
-        files_to_delete = [
-            "graph_chunk_entity_relation.graphml",
-            "kv_store_doc_status.json",
-            "kv_store_full_docs.json",
-            "kv_store_text_chunks.json",
-            "vdb_chunks.json",
-            "vdb_entities.json",
-            "vdb_relationships.json",
-        ]
-
-        for file in files_to_delete:
-            file_path = os.path.join(WORKING_DIR, file)
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                print(f"Deleting old file:: {file_path}")
+        with open("./book.txt", "r", encoding="utf-8") as f:
+            content = f.read()
+
+        # Vector files are only valid for the embedding model and dimension
+        # that built them, so clear the old data files when either changes.
+        # kv_store_llm_response_cache.json is kept so re-ingesting reuses
+        # cached entity extraction responses.
+        embedding_signature = f"{EMBEDDING_MODEL}:{EMBEDDING_DIM}"
+        signature_path = os.path.join(WORKING_DIR, "embedding_signature.txt")
+        previous_signature = None
+        if os.path.exists(signature_path):
+            with open(signature_path, "r", encoding="utf-8") as f:
+                previous_signature = f.read()
+
+        if previous_signature != embedding_signature:
+            files_to_delete = [
+                "graph_chunk_entity_relation.graphml",
+                "kv_store_doc_status.json",
+                "kv_store_full_docs.json",
+                "kv_store_text_chunks.json",
+                "vdb_chunks.json",
+                "vdb_entities.json",
+                "vdb_relationships.json",
+            ]
+
+            for file in files_to_delete:
+                file_path = os.path.join(WORKING_DIR, file)
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                    print(f"Deleting old file:: {file_path}")
+
+            with open(signature_path, "w", encoding="utf-8") as f:
+                f.write(embedding_signature)
 
         # Initialize RAG instance
         rag = await initialize_rag()
 
-        # Test embedding function
+        # Test embedding function, warming up the LLM connection meanwhile
         test_text = ["This is a test string for embedding."]
-        embedding = await rag.embedding_func(test_text)
+        embedding, _ = await asyncio.gather(
+            rag.embedding_func(test_text), warm_up_llm()
+        )
         embedding_dim = embedding.shape[1]
         print("\n=======================")
         print("Test embedding function")
@@ -158,66 +261,74 @@ async def main():
         print(f"Test dict: {test_text}")
         print(f"Detected embedding dimension: {embedding_dim}\n\n")
 
-        with open("./book.txt", "r", encoding="utf-8") as f:
-            await rag.ainsert(f.read())
-
-        # Perform naive search
-        print("\n=====================")
-        print("Query mode: naive")
-        print("=====================")
-        resp = await rag.aquery(
-            "What are the top themes in this story?",
-            param=QueryParam(mode="naive", stream=True),
-        )
-        if inspect.isasyncgen(resp):
-            await print_stream(resp)
-        else:
-            print(resp)
-
-        # Perform local search
-        print("\n=====================")
-        print("Query mode: local")
-        print("=====================")
-        resp = await rag.aquery(
-            "What are the top themes in this story?",
-            param=QueryParam(mode="local", stream=True),
+        # Reuse the graph only if this exact book.txt was fully processed; a
+        # failed or partial earlier run leaves it in another status
+        doc_status = await rag.doc_status.get_by_id(
+            compute_mdhash_id(sanitize_text_for_encoding(content), prefix="doc-")
         )
-        if inspect.isasyncgen(resp):
-            await print_stream(resp)
+        if doc_status and doc_status.get("status") == DocStatus.PROCESSED:
+            print(f"book.txt is unchanged, reusing the graph in {WORKING_DIR}")
         else:
-            print(resp)
-
-        # Perform global search
-        print("\n=====================")
-        print("Query mode: global")
-        print("=====================")
-        resp = await rag.aquery(
-            "What are the top themes in this story?",
-            param=QueryParam(mode="global", stream=True),
+            # Drop whatever an earlier book.txt or failed run left behind
+            await asyncio.gather(
+                *[
+                    storage.drop()
+                    for storage in [
+                        rag.text_chunks,
+                        rag.full_docs,
+                        rag.full_entities,
+                        rag.full_relations,
+                        rag.entities_vdb,
+                        rag.relationships_vdb,
+                        rag.chunks_vdb,
+                        rag.chunk_entity_relation_graph,
+                        rag.doc_status,
+                    ]
+                ]
+            )
+            await rag.ainsert(content)
+
+        # The query modes are independent of each other, so issue them
+        # concurrently and print the streamed answers in order afterwards
+        query = "What are the top themes in this story?"
+        modes = ["naive", "local", "global", "hybrid"]
+        # A short answer per mode is enough for the demo, so request a single
+        # paragraph and cap output tokens to cut generation time
+        responses = await asyncio.gather(
+            *[
+                rag.aquery(
+                    query,
+                    param=QueryParam(
+                        mode=mode,
+                        stream=True,
+                        response_type="Single Paragraph",
+                        model_func=partial(rag.llm_model_func, max_tokens=256),
+                    ),
+                )
+                for mode in modes
+            ]
         )
-        if inspect.isasyncgen(resp):
-            await print_stream(resp)
-        else:
-            print(resp)
-
-        # Perform hybrid search
-        print("\n=====================")
-        print("Query mode: hybrid")
-        print("=====================")
-        resp = await rag.aquery(
-            "What are the top themes in this story?",
-            param=QueryParam(mode="hybrid", stream=True),
-        )
-        if inspect.isasyncgen(resp):
-            await print_stream(resp)
-        else:
-            print(resp)
+
+        for mode, resp in zip(modes, responses):
+            print("\n=====================")
+            print(f"Query mode: {mode}")
+            print("=====================")
+            if inspect.isasyncgen(resp):
+                await print_stream(resp)
+            else:
+                print(resp)
 
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
-        if rag:
-            await rag.finalize_storages()
+        try:
+            if rag:
+                await rag.finalize_storages()
+        finally:
+            # The shared clients are released even if initialization failed
+            save_embedding_cache()
+            await llm_http_client.aclose()
+            await embedding_client._client.aclose()
 
 
 if __name__ == "__main__":
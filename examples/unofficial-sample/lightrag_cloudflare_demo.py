@@ -51,24 +51,19 @@ class CloudflareWorker:
         self.max_tokens = max_tokens
         self.max_response_tokens = max_response_tokens
 
-    async def _send_request(self, model_name: str, input_: dict, debug_log: str):
+    async def _send_request(self, model_name: str, input_: dict):
         headers = {"Authorization": f"Bearer {self.cloudflare_api_key}"}
 
-        print(f"""
-        data sent to Cloudflare
-        ~~~~~~~~~~~
-        {debug_log}
-        """)
+        # Payloads can hold whole embedding batches, so only format them for DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Data sent to Cloudflare model {model_name}: {input_}")
 
         try:
             response_raw = requests.post(
                 f"{self.api_base_url}{model_name}", headers=headers, json=input_
             ).json()
-            print(f"""
-        Cloudflare worker responded with:
-        ~~~~~~~~~~~
-        {str(response_raw)}
-            """)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cloudflare worker responded with: {response_raw}")
             result = response_raw.get("result", {})
 
             if "data" in result:  # Embedding case
@@ -103,30 +98,16 @@ class CloudflareWorker:
             "response_token_limit": self.max_response_tokens,
         }
 
-        return await self._send_request(
-            self.llm_model_name,
-            input_,
-            debug_log=f"\n- model used {self.llm_model_name}\n- system prompt: {system_prompt}\n- query: {prompt}",
-        )
+        return await self._send_request(self.llm_model_name, input_)
 
     async def embedding_chunk(self, texts: list[str]) -> np.ndarray:
-        print(f"""
-        TEXT inputted
-        ~~~~~
-        {texts}
-        """)
-
         input_ = {
             "text": texts,
             "max_tokens": self.max_tokens,
             "response_token_limit": self.max_response_tokens,
         }
 
-        return await self._send_request(
-            self.embedding_model_name,
-            input_,
-            debug_log=f"\n-llm model name {self.embedding_model_name}\n- texts: {texts}",
-        )
+        return await self._send_request(self.embedding_model_name, input_)
 
 
 def configure_logging():
@@ -143,6 +143,10 @@ async def ollama_model_complete(
 
 
 async def ollama_embed(texts: list[str], embed_model, **kwargs) -> np.ndarray:
+    # A caller-supplied client is shared across calls, so it is reused as-is
+    # and left open for the caller to close. Its own host, timeout and headers
+    # apply, and the host, timeout and api_key kwargs are ignored.
+    shared_client = kwargs.pop("client", None)
     api_key = kwargs.pop("api_key", None)
     headers = {
         "Content-Type": "application/json",
@@ -154,7 +158,14 @@ async def ollama_embed(texts: list[str], embed_model, **kwargs) -> np.ndarray:
     host = kwargs.pop("host", None)
     timeout = kwargs.pop("timeout", None)
 
-    ollama_client = ollama.AsyncClient(host=host, timeout=timeout, headers=headers)
+    if shared_client is not None and (host or timeout or api_key):
+        logger.warning(
+            "ollama_embed: host, timeout and api_key are ignored when a client is passed"
+        )
+
+    ollama_client = shared_client or ollama.AsyncClient(
+        host=host, timeout=timeout, headers=headers
+    )
     try:
         options = kwargs.pop("options", {})
         data = await ollama_client.embed(
@@ -163,17 +174,13 @@ async def ollama_embed(texts: list[str], embed_model, **kwargs) -> np.ndarray:
         return np.array(data["embeddings"])
     except Exception as e:
         logger.error(f"Error in ollama_embed: {str(e)}")
-        try:
-            await ollama_client._client.aclose()
-            logger.debug("Successfully closed Ollama client after exception in embed")
-        except Exception as close_error:
-            logger.warning(
-                f"Failed to close Ollama client after exception in embed: {close_error}"
-            )
         raise e
     finally:
-        try:
-            await ollama_client._client.aclose()
-            logger.debug("Successfully closed Ollama client after embed")
-        except Exception as close_error:
-            logger.warning(f"Failed to close Ollama client after embed: {close_error}")
+        if shared_client is None:
+            try:
+                await ollama_client._client.aclose()
+                logger.debug("Successfully closed Ollama client after embed")
+            except Exception as close_error:
+                logger.warning(
+                    f"Failed to close Ollama client after embed: {close_error}"
+                )
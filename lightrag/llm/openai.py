@@ -145,7 +145,8 @@ async def openai_complete_if_cache(
             Special kwargs:
             - openai_client_configs: Dict of configuration options for the AsyncOpenAI client.
                 These will be passed to the client constructor but will be overridden by
-                explicit parameters (api_key, base_url).
+                explicit parameters (api_key, base_url). An `http_client` provided here is
+                treated as shared and is not closed after the call.
             - hashing_kv: Will be removed from kwargs before passing to OpenAI.
             - keyword_extraction: Will be removed from kwargs before passing to OpenAI.
 
@@ -180,6 +181,14 @@ async def openai_complete_if_cache(
         client_configs=client_configs,
     )
 
+    # A caller-supplied http_client is shared across calls, so leave closing it
+    # to the caller instead of tearing it down after every request
+    owns_http_client = "http_client" not in client_configs
+
+    async def close_client():
+        if owns_http_client:
+            await openai_async_client.close()
+
     # Prepare messages
     messages: list[dict[str, Any]] = []
     if system_prompt:
@@ -210,21 +219,21 @@ async def openai_complete_if_cache(
             )
     except APIConnectionError as e:
         logger.error(f"OpenAI API Connection Error: {e}")
-        await openai_async_client.close()  # Ensure client is closed
+        await close_client()  # Close the client unless it is shared
         raise
     except RateLimitError as e:
         logger.error(f"OpenAI API Rate Limit Error: {e}")
-        await openai_async_client.close()  # Ensure client is closed
+        await close_client()  # Close the client unless it is shared
         raise
     except APITimeoutError as e:
         logger.error(f"OpenAI API Timeout Error: {e}")
-        await openai_async_client.close()  # Ensure client is closed
+        await close_client()  # Close the client unless it is shared
         raise
     except Exception as e:
         logger.error(
             f"OpenAI API Call Failed,\nModel: {model},\nParams: {kwargs}, Got: {e}"
         )
-        await openai_async_client.close()  # Ensure client is closed
+        await close_client()  # Close the client unless it is shared
         raise
 
     if hasattr(response, "__aiter__"):
@@ -355,8 +364,8 @@ async def openai_complete_if_cache(
                         logger.warning(
                             f"Failed to close stream response: {close_error}"
                         )
-                # Ensure client is closed in case of exception
-                await openai_async_client.close()
+                # Close the client in case of exception unless it is shared
+                await close_client()
                 raise
             finally:
                 # Final safety check for unclosed COT tags
@@ -384,15 +393,16 @@ async def openai_complete_if_cache(
                         )
 
                 # This prevents resource leaks since the caller doesn't handle closing
-                try:
-                    await openai_async_client.close()
-                    logger.debug(
-                        "Successfully closed OpenAI client for streaming response"
-                    )
-                except Exception as client_close_error:
-                    logger.warning(
-                        f"Failed to close OpenAI client in streaming finally block: {client_close_error}"
-                    )
+                if owns_http_client:
+                    try:
+                        await openai_async_client.close()
+                        logger.debug(
+                            "Successfully closed OpenAI client for streaming response"
+                        )
+                    except Exception as client_close_error:
+                        logger.warning(
+                            f"Failed to close OpenAI client in streaming finally block: {client_close_error}"
+                        )
 
         return inner()
 
@@ -404,7 +414,7 @@ async def openai_complete_if_cache(
                 or not hasattr(response.choices[0], "message")
             ):
                 logger.error("Invalid response from OpenAI API")
-                await openai_async_client.close()  # Ensure client is closed
+                await close_client()  # Close the client unless it is shared
                 raise InvalidResponseError("Invalid response from OpenAI API")
 
             message = response.choices[0].message
@@ -446,7 +456,7 @@ async def openai_complete_if_cache(
             # Validate final content
             if not final_content or final_content.strip() == "":
                 logger.error("Received empty content from OpenAI API")
-                await openai_async_client.close()  # Ensure client is closed
+                await close_client()  # Close the client unless it is shared
                 raise InvalidResponseError("Received empty content from OpenAI API")
 
             # Apply Unicode decoding to final content if needed
@@ -468,8 +478,8 @@ async def openai_complete_if_cache(
 
             return final_content
         finally:
-            # Ensure client is closed in all cases for non-streaming responses
-            await openai_async_client.close()
+            # Close the client in all cases for non-streaming responses unless it is shared
+            await close_client()
 
 
 async def openai_complete(
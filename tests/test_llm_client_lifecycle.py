@@ -0,0 +1,97 @@
+"""
+Tests for client ownership in the OpenAI and Ollama bindings.
+
+A client created inside a binding call must be closed when the call finishes,
+while a client supplied by the caller is shared across calls and must be left
+open for the caller to close.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("openai")
+pytest.importorskip("ollama")
+
+from lightrag.llm import ollama as ollama_binding  # noqa: E402
+from lightrag.llm import openai as openai_binding  # noqa: E402
+
+
+def _mock_openai_client():
+    """Build an AsyncOpenAI stand-in returning a single non-streaming reply."""
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="hello"))]
+    )
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(return_value=response)
+    client.close = AsyncMock()
+    return client
+
+
+def _mock_ollama_client():
+    """Build an ollama.AsyncClient stand-in returning one embedding."""
+    client = MagicMock()
+    client.embed = AsyncMock(return_value={"embeddings": [[0.1, 0.2]]})
+    client._client.aclose = AsyncMock()
+    return client
+
+
+class TestOpenAIClientLifecycle:
+    def test_internal_client_is_closed(self):
+        client = _mock_openai_client()
+        with patch.object(
+            openai_binding, "create_openai_async_client", return_value=client
+        ):
+            result = asyncio.run(
+                openai_binding.openai_complete_if_cache(
+                    "gpt-4o-mini", "ping", api_key="test-key"
+                )
+            )
+
+        assert result == "hello"
+        client.close.assert_awaited_once()
+
+    def test_shared_http_client_is_left_open(self):
+        client = _mock_openai_client()
+        with patch.object(
+            openai_binding, "create_openai_async_client", return_value=client
+        ):
+            result = asyncio.run(
+                openai_binding.openai_complete_if_cache(
+                    "gpt-4o-mini",
+                    "ping",
+                    api_key="test-key",
+                    openai_client_configs={"http_client": MagicMock()},
+                )
+            )
+
+        assert result == "hello"
+        client.close.assert_not_awaited()
+
+
+class TestOllamaEmbedClientLifecycle:
+    def test_internal_client_is_closed(self):
+        client = _mock_ollama_client()
+        with patch.object(ollama_binding.ollama, "AsyncClient", return_value=client):
+            embeddings = asyncio.run(
+                ollama_binding.ollama_embed(["ping"], embed_model="bge-m3:latest")
+            )
+
+        assert embeddings.shape == (1, 2)
+        client._client.aclose.assert_awaited_once()
+
+    def test_shared_client_is_left_open(self):
+        client = _mock_ollama_client()
+        with patch.object(ollama_binding.ollama, "AsyncClient") as client_cls:
+            embeddings = asyncio.run(
+                ollama_binding.ollama_embed(
+                    ["ping"], embed_model="bge-m3:latest", client=client
+                )
+            )
+
+        assert embeddings.shape == (1, 2)
+        client_cls.assert_not_called()
+        client._client.aclose.assert_not_awaited()